@@ -17,17 +17,38 @@ Examples:
 
     # Label validation images
     python auto_label.py --images ../data/images/val --labels ../data/labels/val
+
+    # Larger batches on a big GPU
+    python auto_label.py --batch 16
+
+    # Only use the first two GPUs
+    python auto_label.py --gpus 2
+
+    # Re-label with a new threshold, reading images from a packed cache
+    python auto_label.py --overwrite --conf 0.4 --cache-dir ../data/cache/train
 """
 
 import argparse
+import json
+import os
+import queue
 import sys
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import cv2
 import numpy as np
+import supervision as sv
+import torch
+import torch.multiprocessing as mp
+from PIL import Image
 
 from autodistill_grounding_dino import GroundingDINO
 from autodistill.detection import CaptionOntology
+from groundingdino.util.inference import Model, preprocess_caption
+from groundingdino.util.utils import get_phrases_from_posmap
 
 
 # ── Class mapping (must match configs/golf_ball_dataset.yaml) ────────────────
@@ -37,37 +58,402 @@ ONTOLOGY = CaptionOntology({
     "metal putter head":      "putter",
 })
 
+# GroundingDINO caption built from the prompts above ("a. b.")
+PROMPTS = ONTOLOGY.prompts()
+CAPTION = preprocess_caption(". ".join(PROMPTS))
+
 # YOLO class IDs
 CLASS_NAME_TO_ID = {
     "golf_ball": 0,
     "putter":    1,
 }
 
+# One YOLO label line: class cx cy w h
+LABEL_ROW_FMT = "%d %.6f %.6f %.6f %.6f\n"
+
+# YOLO class ID for each ontology prompt index (prompts are in the same order)
+CLASS_IDS_BY_INDEX = tuple(CLASS_NAME_TO_ID.values())
+
 IMAGE_EXTENSIONS = {".jpg", ".jpeg", ".png", ".bmp", ".tif", ".tiff", ".webp"}
 
+# GroundingDINO's own input resize: shorter side to 800, longer side capped at 1333
+MODEL_SHORT_SIDE = 800
+MODEL_MAX_SIDE = 1333
+
+# libjpeg can decode at 1/2, 1/4 or 1/8 scale in the DCT domain, far cheaper
+# than a full decode + resize.  Largest reduction first.
+JPEG_EXTENSIONS = {".jpg", ".jpeg"}
+REDUCED_DECODE_FLAGS = (
+    (8, cv2.IMREAD_REDUCED_COLOR_8),
+    (4, cv2.IMREAD_REDUCED_COLOR_4),
+    (2, cv2.IMREAD_REDUCED_COLOR_2),
+)
+
+# EXIF orientations that rotate the image by 90 degrees (swap width/height)
+EXIF_ORIENTATION_TAG = 0x0112
+TRANSPOSED_ORIENTATIONS = {5, 6, 7, 8}
+
+# ImageNet normalisation used by GroundingDINO's preprocessing
+PIXEL_MEAN = (0.485, 0.456, 0.406)
+PIXEL_STD = (0.229, 0.224, 0.225)
+
 
 def collect_images(image_dir: Path) -> list[Path]:
     """Gather all image files from a directory (non-recursive)."""
-    images = sorted(
-        p for p in image_dir.iterdir()
-        if p.suffix.lower() in IMAGE_EXTENSIONS
-    )
-    return images
-
-
-def xyxy_to_yolo(x1: float, y1: float, x2: float, y2: float,
-                 img_w: int, img_h: int) -> tuple[float, float, float, float]:
-    """Convert (x1, y1, x2, y2) pixel coords to YOLO normalised format."""
-    cx = ((x1 + x2) / 2.0) / img_w
-    cy = ((y1 + y2) / 2.0) / img_h
-    w = (x2 - x1) / img_w
-    h = (y2 - y1) / img_h
-    return (
-        max(0.0, min(1.0, cx)),
-        max(0.0, min(1.0, cy)),
-        max(0.0, min(1.0, w)),
-        max(0.0, min(1.0, h)),
+    with os.scandir(image_dir) as entries:
+        names = sorted(
+            e.name for e in entries
+            if os.path.splitext(e.name)[1].lower() in IMAGE_EXTENSIONS and e.is_file()
+        )
+    return [image_dir / name for name in names]
+
+
+def xyxy_to_yolo(xyxy: np.ndarray, img_w: int, img_h: int) -> np.ndarray:
+    """Convert an (N, 4) array of (x1, y1, x2, y2) pixel boxes to YOLO normalised
+    (cx, cy, w, h) rows, clipped to [0, 1]."""
+    out = np.empty((len(xyxy), 4), dtype=np.float64)
+    out[:, 0] = (xyxy[:, 0] + xyxy[:, 2]) * (0.5 / img_w)
+    out[:, 1] = (xyxy[:, 1] + xyxy[:, 3]) * (0.5 / img_h)
+    out[:, 2] = (xyxy[:, 2] - xyxy[:, 0]) * (1.0 / img_w)
+    out[:, 3] = (xyxy[:, 3] - xyxy[:, 1]) * (1.0 / img_h)
+    return np.clip(out, 0.0, 1.0, out=out)
+
+
+def read_image_size(path: Path) -> tuple[int, int]:
+    """Return (width, height) from the image header without decoding pixels.
+
+    The size is reported as OpenCV will decode it: cv2 applies the EXIF
+    orientation, so for orientations 5-8 (transposed) width and height swap.
+    """
+    with Image.open(path) as im:
+        img_w, img_h = im.size
+        if im.getexif().get(EXIF_ORIENTATION_TAG, 1) in TRANSPOSED_ORIENTATIONS:
+            return img_h, img_w
+        return img_w, img_h
+
+
+def model_input_size(img_w: int, img_h: int) -> tuple[int, int]:
+    """(width, height) GroundingDINO resizes an image to (``RandomResize([800], max_size=1333)``)."""
+    short, long = min(img_w, img_h), max(img_w, img_h)
+    size = MODEL_SHORT_SIDE
+    if long / short * size > MODEL_MAX_SIDE:
+        size = int(round(MODEL_MAX_SIDE * short / long))
+    if img_w < img_h:
+        return size, int(size * img_h / img_w)
+    return int(size * img_w / img_h), size
+
+
+def decode_flags(path: Path, size: tuple[int, int]) -> int:
+    """Pick the cheapest ``cv2.imread`` mode that still covers the model input size.
+
+    JPEGs much larger than that are decoded straight at a reduced scale;
+    anything else (PNG etc. can't scale during decode) is read in full.
+    """
+    if path.suffix.lower() not in JPEG_EXTENSIONS:
+        return cv2.IMREAD_COLOR
+    img_w, img_h = size
+    scale = model_input_size(img_w, img_h)[0] / img_w
+    for factor, flag in REDUCED_DECODE_FLAGS:
+        if factor * scale <= 1.0:
+            return flag
+    return cv2.IMREAD_COLOR
+
+
+def load_image(
+    path: Path, cache: "ImageCache | None" = None,
+) -> tuple[np.ndarray | None, tuple[int, int] | None]:
+    """Decode an image for the model and probe its true size from the header.
+
+    Reads from ``cache`` instead of the file when one is given.
+    Returns ``(img, (width, height))``; ``img`` is None if the file can't be read.
+    """
+    if cache is not None:
+        data, size = cache.get(path)
+        if size is None:
+            return None, None
+        return cv2.imdecode(data, decode_flags(path, size)), size
+    try:
+        size = read_image_size(path)
+    except OSError:
+        return None, None
+    return cv2.imread(str(path), decode_flags(path, size)), size
+
+
+# ── Packed image cache ───────────────────────────────────────────────────────
+# Bumped whenever the stored sizes change meaning (2: EXIF-oriented sizes)
+IMAGE_CACHE_VERSION = 2
+
+
+class ImageCache:
+    """Every image's encoded bytes packed back to back into one file.
+
+    ``images.bin`` is memory-mapped read-only, so on a rerun (new ``--conf``,
+    ``--overwrite``) the OS page cache serves the bytes instead of reopening
+    thousands of small files.  ``offsets.npy`` holds the N+1 byte offsets and
+    ``index.json`` the name, size, mtime and pixel size of each source image.
+    """
+
+    def __init__(self, cache_dir: Path):
+        self.data = np.memmap(cache_dir / "images.bin", dtype=np.uint8, mode="r")
+        self.offsets = np.load(cache_dir / "offsets.npy")
+        index = json.loads((cache_dir / "index.json").read_text())
+        self.slots = {name: i for i, (name, *_) in enumerate(index["files"])}
+        self.sizes = index["sizes"]
+
+    def get(self, path: Path) -> tuple[np.ndarray, tuple[int, int] | None]:
+        """Return ``(encoded bytes, (width, height))`` for ``path``; size is None if unreadable."""
+        i = self.slots[path.name]
+        size = self.sizes[i]
+        return self.data[self.offsets[i]:self.offsets[i + 1]], tuple(size) if size else None
+
+
+def file_signature(path: Path) -> list:
+    """``[name, bytes, mtime_ns]`` -- enough to notice a replaced or edited image."""
+    st = path.stat()
+    return [path.name, st.st_size, st.st_mtime_ns]
+
+
+def build_image_cache(cache_dir: Path, images: list[Path]) -> None:
+    """(Re)pack ``images`` into ``cache_dir`` unless an up-to-date cache is already there."""
+    index_path = cache_dir / "index.json"
+    files = [file_signature(p) for p in images]
+    index = json.loads(index_path.read_text()) if index_path.exists() else {}
+    if index.get("version") == IMAGE_CACHE_VERSION and index.get("files") == files:
+        print(f"[INFO] Using image cache: {cache_dir}")
+        return
+
+    print(f"[INFO] Building image cache: {cache_dir}")
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    index_path.unlink(missing_ok=True)
+    offsets = np.zeros(len(images) + 1, dtype=np.int64)
+    sizes = []
+    with open(cache_dir / "images.bin", "wb") as out:
+        for i, path in enumerate(images):
+            data = path.read_bytes()
+            out.write(data)
+            offsets[i + 1] = offsets[i] + len(data)
+            try:
+                sizes.append(read_image_size(path))
+            except OSError:
+                sizes.append(None)
+    np.save(cache_dir / "offsets.npy", offsets)
+    # Written last: its presence marks the cache as complete
+    index_path.write_text(json.dumps({"version": IMAGE_CACHE_VERSION, "files": files, "sizes": sizes}))
+
+
+def resize_for_model(img: np.ndarray) -> np.ndarray:
+    """Resize a BGR image to GroundingDINO's input size and convert it to RGB (no padding)."""
+    h, w = img.shape[:2]
+    resized = cv2.resize(img, model_input_size(w, h), interpolation=cv2.INTER_LINEAR)
+    return cv2.cvtColor(resized, cv2.COLOR_BGR2RGB)
+
+
+class CachedTextEncoder(torch.nn.Module):
+    """Drop-in wrapper for GroundingDINO's BERT that encodes a caption once.
+
+    Every image in a run uses the same caption, so the text encoder output is
+    identical across calls.  The first forward is cached and broadcast to the
+    batch size on later calls; a different caption re-encodes transparently.
+    """
+
+    def __init__(self, bert: torch.nn.Module):
+        super().__init__()
+        self.bert = bert
+        self._key = None
+        self._hidden = None
+
+    def forward(self, input_ids, attention_mask=None, **kwargs):
+        key = tuple(input_ids[0].tolist())
+        if key != self._key:
+            output = self.bert(
+                input_ids=input_ids[:1],
+                attention_mask=None if attention_mask is None else attention_mask[:1],
+                **{k: v[:1] for k, v in kwargs.items()},
+            )
+            self._key = key
+            self._hidden = output["last_hidden_state"]
+        return {"last_hidden_state": self._hidden.expand(input_ids.shape[0], -1, -1)}
+
+
+def load_model() -> GroundingDINO:
+    """Build the autodistill GroundingDINO wrapper with text encoding cached."""
+    model = GroundingDINO(ontology=ONTOLOGY)
+    gd_model = model.grounding_dino_model.model
+    gd_model.bert = CachedTextEncoder(gd_model.bert)
+    return model
+
+
+def predict_batch(model: GroundingDINO, images: list[np.ndarray]) -> list[sv.Detections]:
+    """Run GroundingDINO on several BGR images in a single forward pass.
+
+    Equivalent to calling ``model.predict`` once per image: each image is
+    resized and normalised on its own, and the model receives them as a list,
+    which GroundingDINO pads into one batch with a mask so the padding is
+    never attended.  Boxes are returned in each image's pixel coords.
+    """
+    gd = model.grounding_dino_model
+    mean = torch.tensor(PIXEL_MEAN, device=gd.device).view(3, 1, 1)
+    std = torch.tensor(PIXEL_STD, device=gd.device).view(3, 1, 1)
+
+    tensors = []
+    for img in images:
+        rgb = torch.from_numpy(resize_for_model(img)).to(gd.device, non_blocking=True)
+        tensors.append((rgb.permute(2, 0, 1).float().div_(255.0) - mean) / std)
+
+    with torch.no_grad():
+        outputs = gd.model(tensors, captions=[CAPTION] * len(images))
+
+    all_logits = outputs["pred_logits"].sigmoid().cpu()
+    all_boxes = outputs["pred_boxes"].cpu()
+    tokenizer = gd.model.tokenizer
+    tokenized = tokenizer(CAPTION)
+
+    results = []
+    for logits, boxes, img in zip(all_logits, all_boxes, images):
+        keep = logits.max(dim=1)[0] > model.box_threshold
+        logits, boxes = logits[keep], boxes[keep]
+        phrases = [
+            get_phrases_from_posmap(logit > model.text_threshold, tokenized, tokenizer).replace(".", "")
+            for logit in logits
+        ]
+
+        # Boxes are normalised to each image's own (unpadded) extent
+        detections = Model.post_process_result(
+            source_h=img.shape[0], source_w=img.shape[1], boxes=boxes, logits=logits.max(dim=1)[0],
+        )
+        class_ids = Model.phrases2classes(phrases=phrases, classes=PROMPTS)
+        detections.class_id = np.array([-1 if c is None else c for c in class_ids], dtype=int)
+        results.append(detections[detections.class_id >= 0])
+    return results
+
+
+def prefetch_images(items: list[tuple[int, Path]], depth: int, cache: ImageCache | None = None):
+    """Decode images on a background thread pool, ahead of the consumer.
+
+    Yields ``(idx, path, img, size)`` in input order, where ``size`` is the
+    source (width, height); ``img`` is None if the file is unreadable.  At
+    most ``depth`` decoded images wait in the queue, so memory stays bounded
+    however far the consumer falls behind.  An unexpected decode error is
+    re-raised in the consumer rather than ending the input early.
+    """
+    buffer = queue.Queue(maxsize=depth)
+
+    def producer():
+        try:
+            with ThreadPoolExecutor(max_workers=os.cpu_count()) as pool:
+                pending = deque()
+                for idx, path in items:
+                    pending.append((idx, path, pool.submit(load_image, path, cache)))
+                    if len(pending) >= depth:
+                        idx, path, future = pending.popleft()
+                        buffer.put((idx, path, *future.result()))
+                for idx, path, future in pending:
+                    buffer.put((idx, path, *future.result()))
+        except BaseException as exc:
+            buffer.put(exc)
+        finally:
+            buffer.put(None)
+
+    threading.Thread(target=producer, daemon=True).start()
+    while (item := buffer.get()) is not None:
+        if isinstance(item, BaseException):
+            raise item
+        yield item
+
+
+def label_batch(
+    model: GroundingDINO,
+    batch: list[tuple[int, Path, np.ndarray, tuple[int, int]]],
+    label_dir: Path,
+    conf_threshold: float,
+    total_images: int,
+) -> int:
+    """Detect on one batch of decoded images and write their label files.
+
+    Returns the number of detections written.
+    """
+    written = 0
+    batch_detections = predict_batch(model, [img for _, _, img, _ in batch])
+
+    for (idx, img_path, img, (img_w, img_h)), detections in zip(batch, batch_detections):
+        label_path = label_dir / (img_path.stem + ".txt")
+
+        # Filter by confidence / known class and convert all boxes at once
+        keep = (detections.confidence >= conf_threshold) & (detections.class_id < len(CLASS_IDS_BY_INDEX))
+        yolo_ids = np.take(CLASS_IDS_BY_INDEX, detections.class_id[keep])
+        # Detections are in decoded-pixel space; labels use the header size
+        decoded_h, decoded_w = img.shape[:2]
+        to_source = np.array([img_w / decoded_w, img_h / decoded_h] * 2)
+        boxes = xyxy_to_yolo(detections.xyxy[keep] * to_source, img_w, img_h)
+
+        # Write label file (even if empty -- signals the image was processed)
+        # as one preformatted buffer: a single %-format and a single write.
+        rows = np.column_stack([yolo_ids, boxes])
+        label_path.write_text((LABEL_ROW_FMT * len(rows)) % tuple(rows.ravel().tolist()))
+        written += len(boxes)
+
+        print(f"  [{idx}/{total_images}] {img_path.name} → {len(boxes)} detections")
+
+    return written
+
+
+def label_images(
+    model: GroundingDINO,
+    todo: list[tuple[int, Path]],
+    label_dir: Path,
+    conf_threshold: float,
+    batch_size: int,
+    total_images: int,
+    cache_dir: Path | None = None,
+) -> tuple[int, int]:
+    """Label ``(idx, path)`` items in batches; returns (images labeled, detections)."""
+    cache = ImageCache(cache_dir) if cache_dir is not None and todo else None
+    total_detections = 0
+    labeled_count = 0
+
+    # Decode upcoming images on worker threads while the GPU runs the
+    # current batch; the queue depth bounds how far decoding runs ahead.
+    batch = []
+    for idx, img_path, img, size in prefetch_images(todo, depth=2 * batch_size, cache=cache):
+        if img is None:
+            print(f"  [{idx}/{total_images}] SKIP (unreadable): {img_path.name}")
+            continue
+        batch.append((idx, img_path, img, size))
+        if len(batch) == batch_size:
+            total_detections += label_batch(model, batch, label_dir, conf_threshold, total_images)
+            labeled_count += len(batch)
+            batch = []
+    if batch:
+        total_detections += label_batch(model, batch, label_dir, conf_threshold, total_images)
+        labeled_count += len(batch)
+
+    return labeled_count, total_detections
+
+
+def visible_cuda_devices() -> list[str]:
+    """CUDA device IDs this process may use, honouring CUDA_VISIBLE_DEVICES."""
+    visible = os.environ.get("CUDA_VISIBLE_DEVICES")
+    if visible is not None:
+        return [d.strip() for d in visible.split(",") if d.strip()]
+    return [str(i) for i in range(torch.cuda.device_count())]
+
+
+def label_shard_worker(rank, devices, todo, label_dir, conf_threshold, batch_size,
+                       total_images, cache_dir, labeled, detected):
+    """``mp.spawn`` entry point: label every Nth pending image on one GPU."""
+    # CUDA is already initialised by the imports, so CUDA_VISIBLE_DEVICES can't
+    # be changed here; make this shard's GPU the default "cuda" device instead.
+    # devices is the visible list, so rank is also the visible-device ordinal.
+    torch.cuda.set_device(rank)
+    model = load_model()
+    n_labeled, n_detected = label_images(
+        model, todo[rank::len(devices)], label_dir, conf_threshold, batch_size,
+        total_images, cache_dir,
     )
+    with labeled.get_lock():
+        labeled.value += n_labeled
+    with detected.get_lock():
+        detected.value += n_detected
 
 
 def auto_label(
@@ -75,8 +461,16 @@ def auto_label(
     label_dir: Path,
     conf_threshold: float = 0.3,
     overwrite: bool = False,
+    batch_size: int = 8,
+    num_gpus: int | None = None,
+    cache_dir: Path | None = None,
 ):
-    """Run GroundingDINO on every image and write YOLO .txt labels."""
+    """Run GroundingDINO on every image and write YOLO .txt labels.
+
+    Uses every visible GPU (or the first ``num_gpus``), one process each.
+    With ``cache_dir``, images are read from a packed memory-mapped cache that
+    is built on the first run and reused until the image directory changes.
+    """
 
     label_dir.mkdir(parents=True, exist_ok=True)
     images = collect_images(image_dir)
@@ -88,59 +482,43 @@ def auto_label(
     print(f"[INFO] Found {len(images)} images in {image_dir}")
     print(f"[INFO] Labels will be written to {label_dir}")
     print(f"[INFO] Confidence threshold: {conf_threshold}")
+    print(f"[INFO] Batch size: {batch_size}")
     print()
 
-    # Initialise model
-    model = GroundingDINO(ontology=ONTOLOGY)
-
-    total_detections = 0
-    labeled_count = 0
-
+    todo = []
     for idx, img_path in enumerate(images, start=1):
         label_path = label_dir / (img_path.stem + ".txt")
-
         if label_path.exists() and not overwrite:
             print(f"  [{idx}/{len(images)}] SKIP (label exists): {img_path.name}")
             continue
-
-        # Load image to get dimensions
-        img = cv2.imread(str(img_path))
-        if img is None:
-            print(f"  [{idx}/{len(images)}] SKIP (unreadable): {img_path.name}")
-            continue
-        img_h, img_w = img.shape[:2]
-
-        # Run detection
-        detections = model.predict(str(img_path))
-
-        # Filter by confidence and write labels
-        lines = []
-        for i in range(len(detections.xyxy)):
-            conf = detections.confidence[i]
-            if conf < conf_threshold:
-                continue
-
-            class_idx = int(detections.class_id[i])
-            class_name = list(CLASS_NAME_TO_ID.keys())[class_idx] if class_idx < len(CLASS_NAME_TO_ID) else None
-            if class_name is None:
-                continue
-            yolo_id = CLASS_NAME_TO_ID[class_name]
-
-            x1, y1, x2, y2 = detections.xyxy[i]
-            cx, cy, w, h = xyxy_to_yolo(float(x1), float(y1), float(x2), float(y2), img_w, img_h)
-
-            lines.append(f"{yolo_id} {cx:.6f} {cy:.6f} {w:.6f} {h:.6f}")
-
-        # Write label file (even if empty -- signals the image was processed)
-        label_path.write_text("\n".join(lines) + ("\n" if lines else ""))
-
-        total_detections += len(lines)
-        labeled_count += 1
-
-        det_summary = ", ".join(
-            f"{line.split()[0]}={CLASS_NAME_TO_ID}" for line in lines
-        ) if lines else "no detections"
-        print(f"  [{idx}/{len(images)}] {img_path.name} → {len(lines)} detections")
+        todo.append((idx, img_path))
+
+    if cache_dir is not None and todo:
+        build_image_cache(cache_dir, images)
+
+    devices = visible_cuda_devices()
+    if num_gpus is not None:
+        devices = devices[:num_gpus]
+
+    if len(devices) > 1:
+        # Images are independent and each writes its own label file, so every
+        # GPU just takes a strided shard -- only the counters are shared.
+        print(f"[INFO] Sharding across {len(devices)} GPUs: {', '.join(devices)}")
+        ctx = mp.get_context("spawn")
+        labeled = ctx.Value("i", 0)
+        detected = ctx.Value("i", 0)
+        mp.spawn(
+            label_shard_worker,
+            args=(devices, todo, label_dir, conf_threshold, batch_size, len(images), cache_dir,
+                  labeled, detected),
+            nprocs=len(devices),
+        )
+        labeled_count, total_detections = labeled.value, detected.value
+    else:
+        model = load_model()
+        labeled_count, total_detections = label_images(
+            model, todo, label_dir, conf_threshold, batch_size, len(images), cache_dir,
+        )
 
     print()
     print("═" * 60)
@@ -149,6 +527,14 @@ def auto_label(
     print("═" * 60)
 
 
+def positive_int(value: str) -> int:
+    """argparse type for counts that must be at least 1."""
+    n = int(value)
+    if n < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {value}")
+    return n
+
+
 def build_arg_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         description="Auto-label golf images using GroundingDINO"
@@ -169,6 +555,18 @@ def build_arg_parser() -> argparse.ArgumentParser:
         "--overwrite", action="store_true",
         help="Overwrite existing label files"
     )
+    parser.add_argument(
+        "--batch", type=positive_int, default=8,
+        help="Images per GroundingDINO forward pass (default: 8)"
+    )
+    parser.add_argument(
+        "--gpus", type=int, default=None,
+        help="Number of GPUs to shard labeling across (default: all visible)"
+    )
+    parser.add_argument(
+        "--cache-dir", type=str, default=None,
+        help="Pack images into a memory-mapped cache here and reuse it on reruns"
+    )
     return parser
 
 
@@ -181,6 +579,9 @@ def main():
         label_dir=Path(args.labels),
         conf_threshold=args.conf,
         overwrite=args.overwrite,
+        batch_size=args.batch,
+        num_gpus=args.gpus,
+        cache_dir=Path(args.cache_dir) if args.cache_dir else None,
     )
 
 
@@ -9,69 +9,251 @@ an ultralytics YOLOv10 model.  Supports:
 """
 
 import argparse
+import functools
 import sys
+import threading
 import time
 from pathlib import Path
+from types import SimpleNamespace
 
 import cv2
+import numba
 import numpy as np
+import onnxruntime as ort
+import torch
 from ultralytics import YOLO
 
+# Input size is fixed per run, so let cuDNN benchmark and pick the fastest conv algorithms
+torch.backends.cudnn.benchmark = True
+
 
 # ── Class IDs ────────────────────────────────────────────────────────────────
 CLASS_NAMES = {0: "golf_ball", 1: "putter"}
 CLASS_COLORS = {0: (0, 255, 0), 1: (255, 0, 255)}  # BGR: green for ball, magenta for putter
 
 
-def detect_ball_by_color(frame, min_radius=5, max_radius=80):
-    """Detect the golf ball using color filtering (white blob on green surface).
+# ── Color detection constants ───────────────────────────────────────────────
+# HSV range for green/yellow-green mat
+GREEN_HSV_LO = np.array([25, 40, 40])
+GREEN_HSV_HI = np.array([85, 255, 255])
+# White in HSV = low saturation, high value
+WHITE_HSV_LO = np.array([0, 0, 180])
+WHITE_HSV_HI = np.array([180, 60, 255])
+_WHITE_LO_U8 = WHITE_HSV_LO.astype(np.uint8)
+_WHITE_HI_U8 = WHITE_HSV_HI.astype(np.uint8)
+
+_INV_PI = 1.0 / np.pi
+
+# Accepted ball radius range (pixels at full camera resolution)
+BALL_MIN_RADIUS = 5
+BALL_MAX_RADIUS = 80
+
+# Color mask backend preference: CUDA (OpenCV built with CUDA), then OpenCL via
+# the transparent API, then the Numba-fused CPU path.
+_HAVE_CUDA = cv2.cuda.getCudaEnabledDeviceCount() > 0
+
 
-    Returns a list of (cx, cy, radius) tuples for detected balls.
-    Works best from an overhead camera looking at a green putting surface.
+@functools.lru_cache(maxsize=8)
+def _mask_kernels(scale: float = 1.0):
+    """Elliptical morphology kernels for a frame downscaled by ``scale``.
+
+    Sized for full camera resolution (30 px green dilation, 3 px open, 7 px
+    close) and shrunk with the frame so the mask keeps the same footprint.
+    Built once per scale instead of on every frame.
     """
-    hsv = cv2.cvtColor(frame, cv2.COLOR_BGR2HSV)
+    def ellipse(size):
+        size = max(1, round(size * scale))
+        return cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (size, size))
+
+    return SimpleNamespace(dilate=ellipse(30), open=ellipse(3), close=ellipse(7))
+
+
+@numba.njit(parallel=True, fastmath=True, cache=True)
+def _fuse_masks(hsv, green_region, white_lo, white_hi, out):
+    """out = inRange(hsv, white_lo, white_hi) & green_region, in one pass.
+
+    Replaces a separate white ``inRange`` + ``bitwise_and`` (two full-frame
+    passes and an intermediate mask) with a single read of the HSV image.
+    """
+    rows, cols = out.shape
+    for y in numba.prange(rows):
+        for x in range(cols):
+            h = hsv[y, x, 0]
+            s = hsv[y, x, 1]
+            v = hsv[y, x, 2]
+            if (green_region[y, x]
+                    and white_lo[0] <= h <= white_hi[0]
+                    and white_lo[1] <= s <= white_hi[1]
+                    and white_lo[2] <= v <= white_hi[2]):
+                out[y, x] = 255
+            else:
+                out[y, x] = 0
+
+
+def _ball_mask_umat(frame, kernels):
+    """White-on-green ball mask via OpenCV's transparent API (OpenCL)."""
+    hsv = cv2.cvtColor(cv2.UMat(frame), cv2.COLOR_BGR2HSV)
 
     # Step 1: Find the green putting surface to narrow the search area.
-    # HSV range for green/yellow-green mat
-    green_lo = np.array([25, 40, 40])
-    green_hi = np.array([85, 255, 255])
-    green_mask = cv2.inRange(hsv, green_lo, green_hi)
+    green_mask = cv2.inRange(hsv, GREEN_HSV_LO, GREEN_HSV_HI)
 
     # Dilate the green mask to include the ball area sitting on the mat
-    kernel = cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (30, 30))
-    green_region = cv2.dilate(green_mask, kernel, iterations=2)
+    green_region = cv2.dilate(green_mask, kernels.dilate, iterations=2)
 
     # Step 2: Find white/bright areas (the golf ball)
-    # White in HSV = low saturation, high value
-    white_lo = np.array([0, 0, 180])
-    white_hi = np.array([180, 60, 255])
-    white_mask = cv2.inRange(hsv, white_lo, white_hi)
+    white_mask = cv2.inRange(hsv, WHITE_HSV_LO, WHITE_HSV_HI)
 
     # Only keep white areas near the green surface
     ball_mask = cv2.bitwise_and(white_mask, green_region)
 
     # Clean up noise
-    ball_mask = cv2.morphologyEx(ball_mask, cv2.MORPH_OPEN,
-                                  cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (3, 3)))
-    ball_mask = cv2.morphologyEx(ball_mask, cv2.MORPH_CLOSE,
-                                  cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (7, 7)))
+    ball_mask = cv2.morphologyEx(ball_mask, cv2.MORPH_OPEN, kernels.open)
+    ball_mask = cv2.morphologyEx(ball_mask, cv2.MORPH_CLOSE, kernels.close)
+
+    # (contour finding is CPU-only, so download the mask here)
+    return ball_mask.get()
+
+
+@functools.lru_cache(maxsize=4)
+def _cuda_pipeline(scale: float = 1.0):
+    """Stream, upload buffer and morphology filters for the CUDA mask path.
+
+    Built on first use (per scale) and reused for every frame.
+    """
+    kernels = _mask_kernels(scale)
+    return SimpleNamespace(
+        stream=cv2.cuda_Stream(),
+        frame=cv2.cuda_GpuMat(),
+        dilate=cv2.cuda.createMorphologyFilter(cv2.MORPH_DILATE, cv2.CV_8UC1, kernels.dilate, iterations=2),
+        open=cv2.cuda.createMorphologyFilter(cv2.MORPH_OPEN, cv2.CV_8UC1, kernels.open),
+        close=cv2.cuda.createMorphologyFilter(cv2.MORPH_CLOSE, cv2.CV_8UC1, kernels.close),
+    )
+
+
+def _ball_mask_cuda(frame, scale):
+    """White-on-green ball mask on the GPU via OpenCV's CUDA module.
+
+    Everything stays on the device until the final single-channel mask is
+    downloaded for contour finding.
+    """
+    gpu = _cuda_pipeline(scale)
+    stream = gpu.stream
+    gpu.frame.upload(frame, stream)
+    hsv = cv2.cuda.cvtColor(gpu.frame, cv2.COLOR_BGR2HSV, stream=stream)
+
+    green_mask = cv2.cuda.inRange(hsv, tuple(GREEN_HSV_LO.tolist()), tuple(GREEN_HSV_HI.tolist()), stream=stream)
+    green_region = gpu.dilate.apply(green_mask, stream=stream)
+    white_mask = cv2.cuda.inRange(hsv, tuple(WHITE_HSV_LO.tolist()), tuple(WHITE_HSV_HI.tolist()), stream=stream)
+    ball_mask = cv2.cuda.bitwise_and(white_mask, green_region, stream=stream)
+
+    ball_mask = gpu.open.apply(ball_mask, stream=stream)
+    ball_mask = gpu.close.apply(ball_mask, stream=stream)
+
+    mask = ball_mask.download(stream)
+    stream.waitForCompletion()
+    return mask
+
+
+def _ball_mask_cpu(frame, kernels):
+    """White-on-green ball mask on the CPU, with the white test fused in Numba.
+
+    Every stage writes into frame-sized buffers kept on the function and
+    reallocated only when the frame size changes, so steady-state frames do
+    no allocation.  The returned mask is one of those buffers: it is valid
+    until the next call.
+    """
+    bufs = _ball_mask_cpu.buffers
+    if bufs is None or bufs.hsv.shape != frame.shape:
+        rows, cols = frame.shape[:2]
+        bufs = _ball_mask_cpu.buffers = SimpleNamespace(
+            hsv=np.empty((rows, cols, 3), dtype=np.uint8),
+            green=np.empty((rows, cols), dtype=np.uint8),
+            region=np.empty((rows, cols), dtype=np.uint8),
+            ball=np.empty((rows, cols), dtype=np.uint8),
+            clean=np.empty((rows, cols), dtype=np.uint8),
+        )
+
+    cv2.cvtColor(frame, cv2.COLOR_BGR2HSV, dst=bufs.hsv)
+
+    # Green surface, dilated to include the ball sitting on the mat
+    cv2.inRange(bufs.hsv, GREEN_HSV_LO, GREEN_HSV_HI, dst=bufs.green)
+    cv2.dilate(bufs.green, kernels.dilate, dst=bufs.region, iterations=2)
+
+    # White areas near the green surface, in a single fused pass
+    _fuse_masks(bufs.hsv, bufs.region, _WHITE_LO_U8, _WHITE_HI_U8, bufs.ball)
+
+    # Clean up noise
+    cv2.morphologyEx(bufs.ball, cv2.MORPH_OPEN, kernels.open, dst=bufs.clean)
+    cv2.morphologyEx(bufs.clean, cv2.MORPH_CLOSE, kernels.close, dst=bufs.ball)
+    return bufs.ball
+
+
+_ball_mask_cpu.buffers = None
+
+
+def detect_ball_by_color(frame, min_radius=None, max_radius=None, scale=1.0):
+    """Detect the golf ball using color filtering (white blob on green surface).
+
+    Returns a list of (cx, cy, radius) tuples for detected balls, in ``frame``
+    pixels.  Works best from an overhead camera looking at a green putting
+    surface.
+
+    ``scale`` says how much ``frame`` was downscaled from camera resolution;
+    the morphology kernels and the default radius limits (``BALL_MIN_RADIUS``
+    / ``BALL_MAX_RADIUS``) shrink with it.
+
+    The mask pipeline runs on the GPU through ``cv2.cuda`` when OpenCV has a
+    CUDA device, else on a ``cv2.UMat`` via OpenCV's transparent API when
+    OpenCL is available, else on the CPU with the white threshold and
+    green-region AND fused into one Numba kernel.
+    """
+    # Scaled limits stay unrounded so the thresholds keep their full-resolution
+    # meaning (rounding 5 * 0.5 down to 2 would loosen the area floor by a third)
+    if min_radius is None:
+        min_radius = max(1.0, BALL_MIN_RADIUS * scale)
+    if max_radius is None:
+        max_radius = BALL_MAX_RADIUS * scale
+
+    if _HAVE_CUDA:
+        ball_mask = _ball_mask_cuda(frame, scale)
+    elif cv2.ocl.useOpenCL():
+        ball_mask = _ball_mask_umat(frame, _mask_kernels(scale))
+    else:
+        ball_mask = _ball_mask_cpu(frame, _mask_kernels(scale))
 
     # Step 3: Find circular contours
     contours, _ = cv2.findContours(ball_mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
 
-    detections = []
-    for cnt in contours:
-        area = cv2.contourArea(cnt)
-        if area < min_radius * min_radius * 3:
-            continue
+    if not contours:
+        return []
+
+    # Cheap rejections first, for all contours at once, using only bounds the
+    # radius and circularity tests below imply -- so the result is unchanged,
+    # but most noise blobs never reach contourArea / minEnclosingCircle:
+    #   - the enclosing circle spans the box's long side and fits inside the
+    #     box's circumcircle, so min_radius <= r <= max_radius bounds the side;
+    #   - area <= w * h, so circularity >= 0.4 needs short side >= 0.1*pi * long.
+    boxes = np.array([cv2.boundingRect(c) for c in contours], dtype=np.int32)
+    w, h = boxes[:, 2], boxes[:, 3]
+    side = np.maximum(w, h)
+    keep = np.flatnonzero(
+        (side - 1 >= 1.41 * min_radius) & (side <= 2 * max_radius + 2)
+        & (np.minimum(w, h) >= 0.31 * side)
+    )
+    areas = np.fromiter((cv2.contourArea(contours[i]) for i in keep),
+                        dtype=np.float64, count=len(keep))
+    area_ok = areas >= min_radius * min_radius * 3
+    keep, areas = keep[area_ok], areas[area_ok]
 
-        (cx, cy), radius = cv2.minEnclosingCircle(cnt)
+    detections = []
+    for i, area in zip(keep, areas):
+        (cx, cy), radius = cv2.minEnclosingCircle(contours[i])
         radius = int(radius)
         if radius < min_radius or radius > max_radius:
             continue
 
         # Check circularity: area vs enclosing circle area
-        circularity = area / (np.pi * radius * radius) if radius > 0 else 0
+        circularity = area * _INV_PI / max(radius, 1) ** 2
         if circularity < 0.4:
             continue
 
@@ -82,6 +264,156 @@ def detect_ball_by_color(frame, min_radius=5, max_radius=80):
     return detections[:3]
 
 
+class OrtYoloSession:
+    """YOLO ONNX model on ONNX Runtime with a persistent, pre-bound input buffer.
+
+    Frames are letterboxed into a preallocated host buffer and copied into a
+    device-side tensor that stays bound to the session across frames, so the
+    per-frame work is one resize, one H2D copy and the forward pass -- no
+    tensor, binding or output allocation.  Expects the end-to-end (NMS-free)
+    output produced by ``export_onnx`` for YOLOv10: ``(1, N, 6)`` rows of
+    ``x1, y1, x2, y2, score, class`` in input-image pixels.
+    """
+
+    def __init__(self, onnx_path: str, img_size: int = 640):
+        available = ort.get_available_providers()
+        providers = [p for p in ("CUDAExecutionProvider", "CPUExecutionProvider") if p in available]
+        self.session = ort.InferenceSession(onnx_path, providers=providers)
+        device = "cuda" if self.session.get_providers()[0] == "CUDAExecutionProvider" else "cpu"
+
+        inp = self.session.get_inputs()[0]
+        out = self.session.get_outputs()[0]
+        if out.shape[-1] != 6:
+            raise ValueError(
+                f"{onnx_path}: expected end-to-end YOLO output (1, N, 6), got {out.shape}"
+            )
+        dtype = np.float16 if inp.type == "tensor(float16)" else np.float32
+
+        # Static exports fix the input size; ``img_size`` only applies to dynamic ones
+        if isinstance(inp.shape[-1], int):
+            img_size = inp.shape[-1]
+        self.img_size = img_size
+        self._canvas = np.full((img_size, img_size, 3), 114, dtype=np.uint8)
+        self._host_input = np.empty((1, 3, img_size, img_size), dtype=dtype)
+        self._device_input = ort.OrtValue.ortvalue_from_numpy(self._host_input, device, 0)
+        self._binding = self.session.io_binding()
+        self._binding.bind_ortvalue_input(inp.name, self._device_input)
+        self._binding.bind_output(out.name, device)
+
+    def predict(self, frame: np.ndarray, conf_thresh: float):
+        """Detect on a BGR frame; returns (xyxy, conf, cls) in frame pixels."""
+        h, w = frame.shape[:2]
+        scale = min(self.img_size / h, self.img_size / w)
+        new_w, new_h = round(w * scale), round(h * scale)
+        top = (self.img_size - new_h) // 2
+        left = (self.img_size - new_w) // 2
+
+        # Letterbox (grey border stays in place between frames), BGR->RGB, HWC->CHW, /255
+        self._canvas[top:top + new_h, left:left + new_w] = cv2.resize(
+            frame, (new_w, new_h), interpolation=cv2.INTER_LINEAR)
+        np.multiply(self._canvas[..., ::-1].transpose(2, 0, 1), 1.0 / 255.0,
+                    out=self._host_input[0], casting="unsafe")
+        self._device_input.update_inplace(self._host_input)
+
+        self.session.run_with_iobinding(self._binding)
+        dets = self._binding.copy_outputs_to_cpu()[0][0]
+        dets = dets[dets[:, 4] >= conf_thresh]
+
+        xyxy = (dets[:, :4] - (left, top, left, top)) / scale
+        return xyxy, dets[:, 4], dets[:, 5].astype(int)
+
+
+def yolo_detections(model, frame: np.ndarray, img_size: int, conf_thresh: float):
+    """Run a YOLO model (Ultralytics or ``OrtYoloSession``) on one frame.
+
+    Returns ``(xyxy, conf, cls)`` NumPy arrays in frame pixel coordinates.
+    """
+    if isinstance(model, OrtYoloSession):
+        return model.predict(frame, conf_thresh)
+
+    with torch.inference_mode():
+        result = model.predict(source=frame, imgsz=img_size, conf=conf_thresh, verbose=False)[0]
+    boxes = result.boxes
+    if boxes is None:
+        return np.empty((0, 4)), np.empty(0), np.empty(0, dtype=int)
+    return boxes.xyxy.cpu().numpy(), boxes.conf.cpu().numpy(), boxes.cls.cpu().numpy().astype(int)
+
+
+class LatestFrameReader:
+    """Reads a ``cv2.VideoCapture`` on a background thread, keeping only the
+    newest frame.
+
+    Frame grabs overlap with inference instead of blocking it.  ``read()``
+    waits for a frame newer than the last one it returned, so the consumer
+    never processes a frame twice and never falls behind the camera -- any
+    frames it was too slow for are simply dropped.  The reader owns the
+    capture from then on and releases it when its thread exits.
+    """
+
+    def __init__(self, cap: cv2.VideoCapture):
+        self._cap = cap
+        self._cond = threading.Condition()
+        self._frame = None
+        self._seq = 0
+        self._last_seq = 0
+        self._stopped = False
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        try:
+            while not self._stopped:
+                ret, frame = self._cap.read()
+                with self._cond:
+                    if ret:
+                        self._frame = frame
+                        self._seq += 1
+                    else:
+                        self._stopped = True
+                    self._cond.notify()
+        finally:
+            # Only this thread reads the capture, so only it may release it
+            self._cap.release()
+
+    def read(self):
+        """Same contract as ``cv2.VideoCapture.read``: returns (ok, frame)."""
+        with self._cond:
+            self._cond.wait_for(lambda: self._seq != self._last_seq or self._stopped)
+            if self._seq == self._last_seq:
+                return False, None
+            self._last_seq = self._seq
+            return True, self._frame
+
+    def stop(self):
+        """Ask the reader to stop; it releases the capture once ``read`` returns."""
+        self._stopped = True
+        self._thread.join(timeout=1.0)
+
+
+def start_ball_tracker(frame, detections):
+    """Start a tracker on the largest color detection, if there is one.
+
+    Prefers KCF, which ships only in opencv-contrib; plain opencv-python falls
+    back to the slower MIL tracker from the main build.
+    """
+    if not detections:
+        return None
+    create = (getattr(cv2, "TrackerKCF_create", None)
+              or getattr(getattr(cv2, "legacy", None), "TrackerKCF_create", None)
+              or cv2.TrackerMIL_create)
+
+    cx, cy, radius = detections[0]
+    tracker = create()
+    tracker.init(frame, (cx - radius, cy - radius, 2 * radius, 2 * radius))
+    return tracker
+
+
+@functools.lru_cache(maxsize=1024)
+def _text_size(text: str, scale: float) -> tuple[int, int]:
+    """(width, height) of an overlay label; the same few strings repeat every frame."""
+    return cv2.getTextSize(text, cv2.FONT_HERSHEY_SIMPLEX, scale, 1)[0]
+
+
 def train(
     data_yaml: str,
     weights: str = "yolov10n.pt",
@@ -116,6 +448,35 @@ def export_onnx(weights: str, img_size: int = 640, opset: int = 13):
     return onnx_path
 
 
+def export_engine(
+    weights: str,
+    img_size: int = 640,
+    precision: str = "fp16",
+    calib_data: str | None = None,
+    workspace: int = 4,
+):
+    """Export a trained YOLOv10 model straight to a TensorRT engine.
+
+    ``precision`` is ``fp16`` or ``int8``.  INT8 needs ``calib_data``: a
+    dataset YAML whose images feed TensorRT's entropy calibrator.
+    """
+    if precision == "int8" and not calib_data:
+        raise ValueError("INT8 export needs calibration data (--calib)")
+
+    model = YOLO(weights)
+    engine_path = model.export(
+        format="engine",
+        imgsz=img_size,
+        half=precision == "fp16",
+        int8=precision == "int8",
+        data=calib_data if precision == "int8" else None,
+        dynamic=False,
+        workspace=workspace,
+    )
+    print(f"[INFO] {precision.upper()} TensorRT engine exported to {engine_path}")
+    return engine_path
+
+
 def detect(
     source: str,
     weights: str,
@@ -161,11 +522,28 @@ def live(
     img_size: int = 640,
     conf_thresh: float = 0.3,
     use_color: bool = False,
+    color_redetect: int = 10,
+    color_scale: float = 0.5,
 ):
-    """Live camera feed with real-time detection overlay."""
+    """Live camera feed with real-time detection overlay.
+
+    The full color detector runs every ``color_redetect`` frames; in between
+    the ball is followed with an OpenCV tracker, falling back to detection as
+    soon as the tracker loses it.  Color detection and tracking run on the
+    frame downscaled by ``color_scale``; YOLO always sees the full frame.
+
+    ``.onnx`` weights run on ONNX Runtime via ``OrtYoloSession``; anything else
+    (``.pt``, ``.engine``) goes through Ultralytics.
+    """
     model = None
-    if weights:
+    if weights and weights.endswith(".onnx"):
+        model = OrtYoloSession(weights, img_size=img_size)
+    elif weights:
         model = YOLO(weights)
+        if weights.endswith(".pt"):
+            # Fold BatchNorm into the preceding convs once, up front
+            model.model.fuse()
+            model.model.eval()
 
     # Open camera or video source
     cap = cv2.VideoCapture(int(source) if str(source).isdigit() else source)
@@ -191,46 +569,58 @@ def live(
     frame_count = 0
     fps = 0.0
 
+    tracker = None
+    frames_since_detect = 0
+
+    # Cameras are read on a background thread so grabbing the next frame
+    # overlaps with processing this one; video files are read in order.
+    reader = LatestFrameReader(cap) if str(source).isdigit() else cap
+
     while True:
-        ret, frame = cap.read()
+        ret, frame = reader.read()
         if not ret:
             break
 
         # ── YOLO detections ──────────────────────────────────────────
         if model:
-            results = model.predict(
-                source=frame,
-                imgsz=img_size,
-                conf=conf_thresh,
-                verbose=False,
-            )
+            xyxy, confs, cls_ids = yolo_detections(model, frame, img_size, conf_thresh)
 
-            for result in results:
-                boxes = result.boxes
-                if boxes is None:
-                    continue
+            for (x1, y1, x2, y2), confidence, cls_id in zip(xyxy.astype(int).tolist(), confs, cls_ids.tolist()):
+                label = CLASS_NAMES.get(cls_id, f"class_{cls_id}")
+                color = CLASS_COLORS.get(cls_id, (255, 255, 255))
 
-                for box in boxes:
-                    cls_id = int(box.cls[0])
-                    confidence = float(box.conf[0])
-                    x1, y1, x2, y2 = map(int, box.xyxy[0].tolist())
-                    label = CLASS_NAMES.get(cls_id, f"class_{cls_id}")
-                    color = CLASS_COLORS.get(cls_id, (255, 255, 255))
+                cv2.rectangle(frame, (x1, y1), (x2, y2), color, 2)
 
-                    cv2.rectangle(frame, (x1, y1), (x2, y2), color, 2)
+                text = f"{label} {confidence:.2f}"
+                tw, th = _text_size(text, 0.6)
+                cv2.rectangle(frame, (x1, y1 - th - 8), (x1 + tw + 4, y1), color, -1)
+                cv2.putText(frame, text, (x1 + 2, y1 - 4),
+                            cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 0, 0), 1, cv2.LINE_AA)
 
-                    text = f"{label} {confidence:.2f}"
-                    (tw, th), _ = cv2.getTextSize(text, cv2.FONT_HERSHEY_SIMPLEX, 0.6, 1)
-                    cv2.rectangle(frame, (x1, y1 - th - 8), (x1 + tw + 4, y1), color, -1)
-                    cv2.putText(frame, text, (x1 + 2, y1 - 4),
-                                cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 0, 0), 1, cv2.LINE_AA)
-
-                    cx, cy = (x1 + x2) // 2, (y1 + y2) // 2
-                    cv2.circle(frame, (cx, cy), 4, color, -1)
+                cx, cy = (x1 + x2) // 2, (y1 + y2) // 2
+                cv2.circle(frame, (cx, cy), 4, color, -1)
 
         # ── Color-based ball detection ───────────────────────────────
         if use_color:
-            color_dets = detect_ball_by_color(frame)
+            # The mask pipeline is bandwidth-bound, so work on a smaller copy
+            small = frame
+            if color_scale != 1.0:
+                small = cv2.resize(frame, None, fx=color_scale, fy=color_scale,
+                                   interpolation=cv2.INTER_AREA)
+
+            color_dets = None
+            if tracker is not None and frames_since_detect < color_redetect:
+                ok, (bx, by, bw, bh) = tracker.update(small)
+                if ok:
+                    frames_since_detect += 1
+                    color_dets = [(int(bx + bw / 2), int(by + bh / 2), int(max(bw, bh) / 2))]
+            if color_dets is None:
+                color_dets = detect_ball_by_color(small, scale=color_scale)
+                tracker = start_ball_tracker(small, color_dets)
+                frames_since_detect = 1
+
+            color_dets = [(int(cx / color_scale), int(cy / color_scale), int(radius / color_scale))
+                          for cx, cy, radius in color_dets]
             for cx, cy, radius in color_dets:
                 # Cyan circle and crosshair for color detections
                 cv2.circle(frame, (cx, cy), radius, (255, 255, 0), 2)
@@ -238,7 +628,7 @@ def live(
                                cv2.MARKER_CROSS, 12, 2)
 
                 text = f"ball (color) r={radius}"
-                (tw, th), _ = cv2.getTextSize(text, cv2.FONT_HERSHEY_SIMPLEX, 0.5, 1)
+                tw, th = _text_size(text, 0.5)
                 cv2.rectangle(frame, (cx - tw // 2, cy - radius - th - 10),
                               (cx + tw // 2 + 4, cy - radius), (255, 255, 0), -1)
                 cv2.putText(frame, text, (cx - tw // 2 + 2, cy - radius - 4),
@@ -267,11 +657,22 @@ def live(
         if key in (ord("q"), 27):  # q or ESC
             break
 
-    cap.release()
+    if reader is not cap:
+        reader.stop()
+    else:
+        cap.release()
     cv2.destroyAllWindows()
     print("[INFO] Live feed stopped.")
 
 
+def positive_float(value: str) -> float:
+    """argparse type for scale factors that must be greater than 0."""
+    x = float(value)
+    if not x > 0:
+        raise argparse.ArgumentTypeError(f"must be greater than 0, got {value}")
+    return x
+
+
 def build_arg_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         description="Golf ball detection with YOLOv10"
@@ -287,9 +688,13 @@ def build_arg_parser() -> argparse.ArgumentParser:
     p_train.add_argument("--batch", type=int, default=16)
 
     # ── export ───────────────────────────────────────────────────────────
-    p_export = sub.add_parser("export", help="Export to ONNX")
+    p_export = sub.add_parser("export", help="Export to ONNX or a TensorRT engine")
     p_export.add_argument("--weights", required=True, help="Trained .pt file")
     p_export.add_argument("--img-size", type=int, default=640)
+    p_export.add_argument("--precision", choices=("fp32", "fp16", "int8"), default="fp32",
+                          help="fp32 exports ONNX; fp16/int8 export a TensorRT .engine (default: fp32)")
+    p_export.add_argument("--calib", default=None,
+                          help="Dataset YAML with representative frames for INT8 calibration")
 
     # ── detect ───────────────────────────────────────────────────────────
     p_detect = sub.add_parser("detect", help="Run inference")
@@ -302,11 +707,19 @@ def build_arg_parser() -> argparse.ArgumentParser:
     # ── live ──────────────────────────────────────────────────────────
     p_live = sub.add_parser("live", help="Live camera feed with detection overlay")
     p_live.add_argument("--source", default="0", help="Camera index or video path (default: 0)")
-    p_live.add_argument("--weights", default=None, help="YOLO model weights (omit for color-only mode)")
+    p_live.add_argument("--weights", default=None,
+                        help="YOLO weights: .pt, .engine, or .onnx to run on ONNX Runtime "
+                             "(omit for color-only mode)")
     p_live.add_argument("--img-size", type=int, default=640)
     p_live.add_argument("--conf", type=float, default=0.3)
     p_live.add_argument("--color", action="store_true",
                         help="Enable color-based ball detection (cyan circles)")
+    p_live.add_argument("--color-redetect", type=int, default=10,
+                        help="Run full color detection every N frames and track "
+                             "in between (default: 10, 1 disables tracking)")
+    p_live.add_argument("--color-scale", type=positive_float, default=0.5,
+                        help="Downscale factor for the color detector's input frame "
+                             "(default: 0.5, 1.0 for full resolution)")
 
     return parser
 
@@ -324,7 +737,18 @@ def main():
             batch_size=args.batch,
         )
     elif args.command == "export":
-        export_onnx(weights=args.weights, img_size=args.img_size)
+        if args.precision == "fp32":
+            export_onnx(weights=args.weights, img_size=args.img_size)
+        else:
+            if args.precision == "int8" and not args.calib:
+                print("[ERROR] --calib is required for --precision int8")
+                sys.exit(1)
+            export_engine(
+                weights=args.weights,
+                img_size=args.img_size,
+                precision=args.precision,
+                calib_data=args.calib,
+            )
     elif args.command == "detect":
         detect(
             source=args.source,
@@ -343,6 +767,8 @@ def main():
             img_size=args.img_size,
             conf_thresh=args.conf,
             use_color=args.color,
+            color_redetect=args.color_redetect,
+            color_scale=args.color_scale,
         )
     else:
         parser.print_help()
@@ -21,23 +21,33 @@ Usage:
 """
 
 import argparse
+import asyncio
+import atexit
+import contextlib
 import json
+import mimetypes
 import os
 import sys
 import time
 from pathlib import Path
 
-import requests as _requests
+import httpx
+import numpy as np
+from tqdm import tqdm
 
 from label_studio_sdk import Client
 
 # #region agent log
 LOG_PATH = "/home/connorwoodford/Desktop/projects/golf-sim/.cursor/debug.log"
+# Only written when GOLF_SIM_DEBUG is set; opened once and buffered
+_LOG_FH = open(LOG_PATH, "a", buffering=1 << 16) if os.environ.get("GOLF_SIM_DEBUG") else None
+if _LOG_FH is not None:
+    atexit.register(_LOG_FH.close)
 def _dbg(hypothesisId, location, message, data=None):
-    import json as _j
+    if _LOG_FH is None:
+        return
     entry = {"hypothesisId": hypothesisId, "location": location, "message": message, "data": data or {}, "timestamp": int(time.time()*1000)}
-    with open(LOG_PATH, "a") as f:
-        f.write(_j.dumps(entry) + "\n")
+    _LOG_FH.write(json.dumps(entry) + "\n")
 # #endregion
 
 # ── Constants ────────────────────────────────────────────────────────────────
@@ -48,6 +58,30 @@ CLASS_NAME_TO_ID = {"golf_ball": 0, "putter": 1}
 
 IMAGE_EXTENSIONS = {".jpg", ".jpeg", ".png", ".bmp", ".tif", ".tiff", ".webp"}
 
+# Images are uploaded several per multipart request; a batch is sent once it
+# reaches --batch-size files or this many bytes, whichever comes first
+UPLOAD_BATCH_MAX_BYTES = 20 * 1024 * 1024
+
+# Keep-alive connection pool shared by every request in a client, and how
+# many times a failed connection attempt is retried
+HTTP_MAX_CONNECTIONS = 16
+HTTP_CONNECT_RETRIES = 3
+# Gateway errors on GETs are retried with exponential backoff (0.2 s, 0.4 s,
+# 0.8 s), as urllib3's Retry(backoff_factor=0.2) did. POSTs are never resent:
+# a 502/504 can arrive after the server has already committed the write
+HTTP_RETRY_STATUSES = {502, 503, 504}
+HTTP_STATUS_RETRIES = 3
+HTTP_RETRY_BACKOFF = 0.2
+# Uploads can take a while on a busy server; don't give up after httpx's 5 s
+HTTP_TIMEOUT = httpx.Timeout(60.0, connect=10.0)
+
+# Tasks per /api/tasks page -- most projects fit in a single request
+TASKS_PAGE_SIZE = 1000
+
+# Pre-annotations are sent to the bulk predictions endpoint this many at a time
+PREDICTION_BULK_SIZE = 1000
+PREDICTION_MODEL_VERSION = "grounding_dino_auto"
+
 # Label Studio labeling config for bounding-box annotation
 LABELING_CONFIG = """
 <View>
@@ -60,64 +94,201 @@ LABELING_CONFIG = """
 """
 
 
-def yolo_to_ls_bbox(class_id: int, cx: float, cy: float, w: float, h: float):
-    """Convert YOLO normalised coords to Label Studio percentage-based bbox."""
-    return {
-        "x": (cx - w / 2) * 100.0,
-        "y": (cy - h / 2) * 100.0,
-        "width": w * 100.0,
-        "height": h * 100.0,
-        "rectanglelabels": [CLASS_ID_TO_NAME.get(class_id, f"class_{class_id}")],
-    }
+def yolo_to_ls_bboxes(rows: np.ndarray) -> list[dict]:
+    """Convert (N, 5) YOLO rows (class cx cy w h) to Label Studio percentage-based bboxes."""
+    cx, cy, w, h = rows[:, 1:5].T * 100.0
+    return [
+        {
+            "x": x,
+            "y": y,
+            "width": bw,
+            "height": bh,
+            "rectanglelabels": [CLASS_ID_TO_NAME.get(class_id, f"class_{class_id}")],
+        }
+        for class_id, x, y, bw, bh in zip(
+            rows[:, 0].astype(int).tolist(),
+            (cx - w / 2).tolist(), (cy - h / 2).tolist(), w.tolist(), h.tolist(),
+        )
+    ]
 
 
 def parse_yolo_label(label_path: Path) -> list[dict]:
     """Parse a YOLO .txt label file into Label Studio annotation format."""
-    results = []
-    text = label_path.read_text().strip()
-    if not text:
-        return results
-
-    for line in text.splitlines():
-        parts = line.strip().split()
-        if len(parts) < 5:
-            continue
-        class_id = int(parts[0])
-        cx, cy, w, h = float(parts[1]), float(parts[2]), float(parts[3]), float(parts[4])
-
-        bbox = yolo_to_ls_bbox(class_id, cx, cy, w, h)
-        results.append({
+    text = label_path.read_text()
+    if not text.strip():
+        return []
+
+    lines = text.splitlines()
+    try:
+        rows = np.loadtxt(lines, ndmin=2, usecols=range(5))
+    except ValueError:
+        # Skip malformed (short) lines rather than rejecting the whole file
+        lines = [l for l in lines if len(l.split()) >= 5]
+        if not lines:
+            return []
+        rows = np.loadtxt(lines, ndmin=2, usecols=range(5))
+
+    return [
+        {
             "from_name": "label",
             "to_name": "image",
             "type": "rectanglelabels",
             "value": bbox,
+        }
+        for bbox in yolo_to_ls_bboxes(rows.reshape(-1, 5))
+    ]
+
+
+def collect_images(directory: Path) -> list[Path]:
+    """Gather image files sorted by name."""
+    with os.scandir(directory) as entries:
+        names = sorted(
+            e.name for e in entries
+            if os.path.splitext(e.name)[1].lower() in IMAGE_EXTENSIONS and e.is_file()
+        )
+    return [directory / name for name in names]
+
+
+def collect_label_stems(directory: Path) -> set[str]:
+    """Stems of the .txt label files in a directory (empty if it doesn't exist)."""
+    if not directory.is_dir():
+        return set()
+    with os.scandir(directory) as entries:
+        return {e.name[:-4] for e in entries if e.name.endswith(".txt")}
+
+
+def upload_batches(image_files: list[Path], batch_size: int,
+                   max_bytes: int = UPLOAD_BATCH_MAX_BYTES):
+    """Yield consecutive groups of at most ``batch_size`` files / ``max_bytes`` bytes."""
+    batch, batch_bytes = [], 0
+    for path in image_files:
+        size = os.path.getsize(path)
+        if batch and (len(batch) >= batch_size or batch_bytes + size > max_bytes):
+            yield batch
+            batch, batch_bytes = [], 0
+        batch.append(path)
+        batch_bytes += size
+    if batch:
+        yield batch
+
+
+def upload_content_type(path: Path) -> str:
+    """MIME type sent with an uploaded image, from its extension."""
+    return mimetypes.guess_type(path.name)[0] or "application/octet-stream"
+
+
+def match_upload_name(image_url: str, names: set[str]) -> str | None:
+    """Recover the original filename of an uploaded image from its task URL.
+
+    Label Studio prepends a UUID prefix to uploaded filenames, e.g.
+    "/data/upload/20/85d18acf-frame_000001.png" -> "frame_000001.png".
+    """
+    basename = image_url.rsplit("/", 1)[-1]
+    original = basename.split("-", 1)[1] if "-" in basename else basename
+    if original in names:
+        return original
+    if basename in names:
+        return basename
+    # Unusual URL layout -- fall back to a suffix scan
+    return next((name for name in names if image_url.endswith(name)), None)
+
+
+async def get_with_retry(client: httpx.AsyncClient, url: str, **kwargs) -> httpx.Response:
+    """``client.get``, retried with backoff while the server answers 502/503/504."""
+    for attempt in range(HTTP_STATUS_RETRIES + 1):
+        resp = await client.get(url, **kwargs)
+        if resp.status_code not in HTTP_RETRY_STATUSES or attempt == HTTP_STATUS_RETRIES:
+            return resp
+        await asyncio.sleep(HTTP_RETRY_BACKOFF * 2 ** attempt)
+
+
+@contextlib.asynccontextmanager
+async def _login_client(ls_url: str, email: str, password: str, concurrency: int = 1):
+    """Authenticate to Label Studio via session login (email/password + CSRF).
+
+    Yields an async client whose cookie jar holds the session and whose
+    keep-alive pool is large enough for ``concurrency`` requests in flight.
+    """
+    max_connections = max(HTTP_MAX_CONNECTIONS, concurrency)
+    limits = httpx.Limits(max_connections=max_connections,
+                          max_keepalive_connections=max_connections)
+    async with httpx.AsyncClient(
+        base_url=ls_url,
+        transport=httpx.AsyncHTTPTransport(limits=limits, retries=HTTP_CONNECT_RETRIES),
+        timeout=HTTP_TIMEOUT,
+        follow_redirects=True,
+    ) as client:
+        login_page = await get_with_retry(client, "/user/login")
+        login_page.raise_for_status()
+        csrf = client.cookies.get("csrftoken", "")
+        resp = await client.post(
+            "/user/login",
+            data={"email": email, "password": password, "csrfmiddlewaretoken": csrf},
+            headers={"Referer": f"{ls_url}/user/login"},
+        )
+        resp.raise_for_status()
+        # Verify we're actually logged in
+        check = await get_with_retry(client, "/api/current-user/whoami")
+        if check.status_code != 200:
+            raise RuntimeError(f"Session login failed (whoami returned {check.status_code})")
+        # #region agent log
+        _dbg("FIX", "create_session", "Session login succeeded", {"status": check.status_code})
+        # #endregion
+
+        # Send the CSRF token on every request from here on, and pick up a new
+        # one whenever Django rotates it, instead of reading the cookie jar per call
+        client.headers["X-CSRFToken"] = client.cookies.get("csrftoken", "")
+
+        async def refresh_csrf(resp: httpx.Response):
+            token = resp.cookies.get("csrftoken")
+            if token:
+                client.headers["X-CSRFToken"] = token
+
+        client.event_hooks["response"].append(refresh_csrf)
+        yield client
+
+
+def write_label_file(path: Path, text: str) -> None:
+    """Write a label file with one open/write/close and no pathlib layers."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, text.encode())
+    finally:
+        os.close(fd)
+
+
+async def iter_tasks(client: httpx.AsyncClient, project_id: int,
+                     page_size: int = TASKS_PAGE_SIZE):
+    """Yield every task in a project, fetching one page at a time."""
+    page = 1
+    seen = 0
+    while True:
+        resp = await get_with_retry(client, "/api/tasks", params={
+            "project": project_id, "page": page, "page_size": page_size
         })
-    return results
-
-
-def _create_session(ls_url: str, email: str, password: str) -> _requests.Session:
-    """Authenticate to Label Studio via session login (email/password + CSRF)."""
-    sess = _requests.Session()
-    login_page = sess.get(f"{ls_url}/user/login")
-    login_page.raise_for_status()
-    csrf = sess.cookies.get("csrftoken", "")
-    resp = sess.post(
-        f"{ls_url}/user/login",
-        data={"email": email, "password": password, "csrfmiddlewaretoken": csrf},
-        headers={"Referer": f"{ls_url}/user/login"},
-    )
-    resp.raise_for_status()
-    # Verify we're actually logged in
-    check = sess.get(f"{ls_url}/api/current-user/whoami")
-    if check.status_code != 200:
-        raise RuntimeError(f"Session login failed (whoami returned {check.status_code})")
-    # #region agent log
-    _dbg("FIX", "create_session", "Session login succeeded", {"status": check.status_code})
-    # #endregion
-    return sess
+        resp.raise_for_status()
+        data = resp.json()
+        tasks = data if isinstance(data, list) else data.get("tasks", data.get("results", []))
+        if not tasks:
+            return
+        for task in tasks:
+            yield task
+        seen += len(tasks)
+        # /api/tasks reports "total"; trust it over page length, since the
+        # server may cap page_size below what was asked for
+        if isinstance(data, dict) and "total" in data:
+            if seen >= data["total"]:
+                return
+        elif isinstance(data, dict) and "next" in data:
+            if not data["next"]:
+                return
+        # Without either, a short page is the last one
+        elif len(tasks) < page_size:
+            return
+        page += 1
 
 
-def import_to_label_studio(
+async def import_to_label_studio(
     images_dir: Path,
     labels_dir: Path,
     ls_url: str,
@@ -125,27 +296,57 @@ def import_to_label_studio(
     password: str,
     project_name: str = "Golf Ball Detection",
     project_id: int | None = None,
+    batch_size: int = 20,
+    concurrency: int = 6,
 ):
-    """Create or reuse a project, import images, and attach pre-annotations."""
+    """Create or reuse a project, import images, and attach pre-annotations.
+
+    Upload batches and prediction POSTs are sent ``concurrency`` at a time.
+    """
+
+    async with _login_client(ls_url, email, password, concurrency) as client:
+        project_id = await _import_project(
+            client, images_dir, labels_dir, project_name, project_id, batch_size, concurrency,
+        )
+
+    print(f"[INFO] Open Label Studio at: {ls_url}/projects/{project_id}")
+    print()
+    print("Review workflow:")
+    print("  1. Open the URL above in your browser")
+    print("  2. Click through images -- pre-annotations are shown as boxes")
+    print("  3. Correct, delete, or add boxes as needed, then submit each image")
+    print(f"  4. When done, export via: python import_to_label_studio.py "
+          f"--export --project-id {project_id} --email <email> --password <password>")
+
 
-    sess = _create_session(ls_url, email, password)
+async def _import_project(
+    client: httpx.AsyncClient,
+    images_dir: Path,
+    labels_dir: Path,
+    project_name: str,
+    project_id: int | None,
+    batch_size: int,
+    concurrency: int,
+) -> int:
+    """Body of ``import_to_label_studio`` once logged in; returns the project ID."""
+    # Bounds the requests in flight; everything runs on one event loop thread
+    in_flight = asyncio.Semaphore(concurrency)
 
     if project_id:
         # Reuse existing project -- delete old tasks first so we start fresh
         print(f"[INFO] Reusing existing project (id={project_id}), clearing old tasks...")
-        csrf = sess.cookies.get("csrftoken", "")
-        resp = sess.get(f"{ls_url}/api/tasks", params={"project": project_id, "page_size": 10000})
+        resp = await get_with_retry(
+            client, "/api/tasks", params={"project": project_id, "page_size": 10000},
+        )
         if resp.status_code == 200:
             data = resp.json()
             tasks_list = data if isinstance(data, list) else data.get("tasks", data.get("results", []))
             task_ids = [t["id"] for t in tasks_list]
             if task_ids:
-                csrf = sess.cookies.get("csrftoken", "")
-                del_resp = sess.post(
-                    f"{ls_url}/api/dm/actions",
+                del_resp = await client.post(
+                    "/api/dm/actions",
                     params={"project": project_id, "id": "delete_tasks"},
                     json={"selectedItems": {"all": True, "excluded": []}},
-                    headers={"X-CSRFToken": csrf},
                 )
                 # #region agent log
                 _dbg("FIX", "import:delete_tasks", "Delete old tasks", {"status": del_resp.status_code, "count": len(task_ids)})
@@ -154,11 +355,9 @@ def import_to_label_studio(
         print(f"[INFO] Using project: id={project_id}")
     else:
         # Create a new project
-        csrf = sess.cookies.get("csrftoken", "")
-        resp = sess.post(
-            f"{ls_url}/api/projects",
+        resp = await client.post(
+            "/api/projects",
             json={"title": project_name, "label_config": LABELING_CONFIG},
-            headers={"X-CSRFToken": csrf},
         )
         # #region agent log
         _dbg("FIX", "import:create_project", "Create project response", {"status": resp.status_code, "body": resp.text[:300]})
@@ -169,64 +368,68 @@ def import_to_label_studio(
         print(f"[INFO] Created project: '{project_name}' (id={project_id})")
 
     # Collect images
-    image_files = sorted(
-        p for p in images_dir.iterdir()
-        if p.suffix.lower() in IMAGE_EXTENSIONS
-    )
+    image_files = collect_images(images_dir)
     if not image_files:
         print(f"[ERROR] No images in {images_dir}")
         sys.exit(1)
 
-    print(f"[INFO] Uploading {len(image_files)} images via import endpoint...")
-
-    # Upload images directly through the import endpoint (multipart form data).
-    # This creates tasks automatically.
-    for idx, img_path in enumerate(image_files, start=1):
-        csrf = sess.cookies.get("csrftoken", "")
-        with open(img_path, "rb") as f:
-            resp = sess.post(
-                f"{ls_url}/api/projects/{project_id}/import",
-                files={"file": (img_path.name, f, "image/png")},
-                headers={"X-CSRFToken": csrf},
-            )
-        # #region agent log
-        _dbg("H1", f"import:upload_{idx}", "File import result", {"file": img_path.name, "status": resp.status_code, "body": resp.text[:300]})
-        # #endregion
-        if resp.status_code in (200, 201):
-            print(f"  [{idx}/{len(image_files)}] Imported: {img_path.name}")
-        else:
-            print(f"  [{idx}/{len(image_files)}] FAILED ({resp.status_code}): {img_path.name}")
+    print(f"[INFO] Uploading {len(image_files)} images via import endpoint "
+          f"({batch_size} per request)...")
+
+    # Upload images directly through the import endpoint (multipart form data,
+    # one field per image).  This creates tasks automatically and, with
+    # return_task_ids, reports their IDs in upload order.  Each file needs its
+    # own field name, as Label Studio's upload UI sends them: the importer
+    # reads request.FILES.items(), which keeps only the last file per name.
+    async def upload_batch(batch: list[Path]) -> tuple[list[Path], httpx.Response]:
+        # Files are only opened once this batch may send, and httpx streams
+        # them into the request, so at most --concurrency batches of handles
+        # are open and no image is held in memory whole
+        async with in_flight:
+            with contextlib.ExitStack() as stack:
+                files = [
+                    (p.name, (p.name, stack.enter_context(open(p, "rb")), upload_content_type(p)))
+                    for p in batch
+                ]
+                resp = await client.post(
+                    f"/api/projects/{project_id}/import",
+                    params={"return_task_ids": "true"},
+                    files=files,
+                )
+        return batch, resp
 
-    # Fetch all tasks from the project to get task IDs and map to filenames
-    print("[INFO] Fetching tasks to attach predictions...")
     filename_to_task_id = {}
-    page = 1
-    while True:
-        resp = sess.get(f"{ls_url}/api/tasks", params={
-            "project": project_id, "page": page, "page_size": 100
-        })
-        resp.raise_for_status()
-        data = resp.json()
-        tasks_list = data if isinstance(data, list) else data.get("tasks", data.get("results", []))
-        if not tasks_list:
-            break
-        for task in tasks_list:
-            task_id = task.get("id")
-            image_url = task.get("data", {}).get("image", "")
-            # LS prepends a UUID prefix to uploaded filenames, e.g.
-            # "/data/upload/20/85d18acf-frame_000001.png"
-            # Match by checking which original filename the URL ends with.
-            for img in image_files:
-                if image_url.endswith(img.name):
-                    filename_to_task_id[img.name] = task_id
-                    break
-        # #region agent log
-        _dbg("H2", "import:fetch_tasks", "Fetched tasks page", {"page": page, "count": len(tasks_list), "sample_map": dict(list(filename_to_task_id.items())[:3])})
-        # #endregion
-        if isinstance(data, dict) and data.get("next"):
-            page += 1
-        else:
-            break
+    unmatched = set()
+    batches = list(upload_batches(image_files, batch_size))
+    # One progress bar instead of a line per batch; only failures are printed.
+    # Results are handled on the event loop thread, so the bar needs no lock.
+    with tqdm(total=len(image_files), unit="img") as bar:
+        for next_done in asyncio.as_completed([upload_batch(b) for b in batches]):
+            batch, resp = await next_done
+            bar.update(len(batch))
+            bar.set_postfix_str(f"last={batch[-1].name}")
+            if resp.status_code in (200, 201):
+                task_ids = resp.json().get("task_ids", [])
+                if len(task_ids) == len(batch):
+                    filename_to_task_id.update(zip((p.name for p in batch), task_ids))
+                else:
+                    bar.write(f"  [WARN] Got {len(task_ids)} task IDs for {len(batch)} images "
+                              f"({batch[0].name} .. {batch[-1].name}); matching by filename instead")
+                    unmatched.update(p.name for p in batch)
+            else:
+                # #region agent log
+                _dbg("H1", f"import:upload_{bar.n}", "Batch import failed", {"files": len(batch), "status": resp.status_code, "body": resp.text[:300]})
+                # #endregion
+                bar.write(f"  FAILED ({resp.status_code}): {batch[0].name} .. {batch[-1].name}")
+
+    # Older Label Studio versions don't return task IDs -- only then look the
+    # tasks up and match their upload URLs back to filenames
+    if unmatched:
+        print("[INFO] Fetching tasks to attach predictions...")
+        async for task in iter_tasks(client, project_id):
+            name = match_upload_name(task.get("data", {}).get("image", ""), unmatched)
+            if name is not None:
+                filename_to_task_id[name] = task.get("id")
 
     # #region agent log
     _dbg("H2", "import:task_map", "Final filename->task_id map", {"total": len(filename_to_task_id), "entries": dict(list(filename_to_task_id.items())[:5])})
@@ -234,50 +437,63 @@ def import_to_label_studio(
     print(f"[INFO] Matched {len(filename_to_task_id)} tasks to filenames")
 
     # Add pre-annotations (predictions) to tasks that have matching YOLO labels
-    pre_annotated = 0
+    label_stems = collect_label_stems(labels_dir)
+    predictions = []
     for img_path in image_files:
         task_id = filename_to_task_id.get(img_path.name)
         if not task_id:
             continue
 
-        label_path = labels_dir / (img_path.stem + ".txt")
-        if not label_path.exists():
+        if img_path.stem not in label_stems:
             continue
 
-        results = parse_yolo_label(label_path)
+        results = parse_yolo_label(labels_dir / (img_path.stem + ".txt"))
         if not results:
             continue
+        predictions.append({
+            "task": task_id,
+            "model_version": PREDICTION_MODEL_VERSION,
+            "result": results,
+        })
 
-        csrf = sess.cookies.get("csrftoken", "")
-        pred_resp = sess.post(
-            f"{ls_url}/api/predictions",
-            json={
-                "task": task_id,
-                "model_version": "grounding_dino_auto",
-                "result": results,
-            },
-            headers={"X-CSRFToken": csrf},
-        )
+    async def post_prediction(prediction: dict) -> bool:
+        async with in_flight:
+            pred_resp = await client.post("/api/predictions", json=prediction)
+        if pred_resp.status_code in (200, 201):
+            return True
+        # #region agent log
+        _dbg("FIX", "import:pred_fail", "Prediction add failed", {"task_id": prediction["task"], "status": pred_resp.status_code, "body": pred_resp.text[:200]})
+        # #endregion
+        return False
+
+    async def post_prediction_chunk(chunk: list[dict]) -> int:
+        # One request for the whole chunk; servers without the bulk
+        # endpoint get a POST per task instead
+        async with in_flight:
+            pred_resp = await client.post(
+                f"/api/projects/{project_id}/import/predictions",
+                json=chunk,
+            )
         if pred_resp.status_code in (200, 201):
-            pre_annotated += 1
-        else:
-            # #region agent log
-            _dbg("FIX", "import:pred_fail", "Prediction add failed", {"task_id": task_id, "status": pred_resp.status_code, "body": pred_resp.text[:200]})
-            # #endregion
-            pass
+            return len(chunk)
+        # #region agent log
+        _dbg("FIX", "import:bulk_pred_fail", "Bulk prediction import failed", {"count": len(chunk), "status": pred_resp.status_code, "body": pred_resp.text[:200]})
+        # #endregion
+        if pred_resp.status_code in (404, 405):
+            # Each per-task POST takes its own slot, so they still run
+            # --concurrency at a time
+            return sum(await asyncio.gather(*(post_prediction(p) for p in chunk)))
+        return 0
+
+    chunks = [predictions[i:i + PREDICTION_BULK_SIZE]
+              for i in range(0, len(predictions), PREDICTION_BULK_SIZE)]
+    pre_annotated = sum(await asyncio.gather(*(post_prediction_chunk(c) for c in chunks)))
 
     print(f"[INFO] Imported {len(filename_to_task_id)} tasks ({pre_annotated} with pre-annotations)")
-    print(f"[INFO] Open Label Studio at: {ls_url}/projects/{project_id}")
-    print()
-    print("Review workflow:")
-    print("  1. Open the URL above in your browser")
-    print("  2. Click through images -- pre-annotations are shown as boxes")
-    print("  3. Correct, delete, or add boxes as needed, then submit each image")
-    print(f"  4. When done, export via: python import_to_label_studio.py "
-          f"--export --project-id {project_id} --email <email> --password <password>")
+    return project_id
 
 
-def export_from_label_studio(
+async def export_from_label_studio(
     project_id: int,
     output_dir: Path,
     ls_url: str,
@@ -286,78 +502,62 @@ def export_from_label_studio(
 ):
     """Export corrected annotations from Label Studio back to YOLO format."""
 
-    sess = _create_session(ls_url, email, password)
-
-    # Fetch all tasks with annotations
-    all_tasks = []
-    page = 1
-    while True:
-        resp = sess.get(f"{ls_url}/api/tasks", params={
-            "project": project_id, "page": page, "page_size": 100
-        })
-        resp.raise_for_status()
-        data = resp.json()
-        tasks = data.get("tasks", data) if isinstance(data, dict) else data
-        if isinstance(data, dict) and "tasks" in data:
-            tasks = data["tasks"]
-        elif isinstance(data, list):
-            tasks = data
-        else:
-            tasks = data.get("results", [])
-        if not tasks:
-            break
-        all_tasks.extend(tasks)
-        if isinstance(data, dict) and not data.get("next"):
-            break
-        page += 1
-
     output_dir.mkdir(parents=True, exist_ok=True)
     exported = 0
 
-    for task in all_tasks:
-        image_path = task["data"].get("image", "")
-        stem = Path(image_path).stem
+    async with _login_client(ls_url, email, password) as client:
+        # Tasks are streamed page by page, so labels are written as they arrive
+        async for task in iter_tasks(client, project_id):
+            image_path = task["data"].get("image", "")
+            stem = Path(image_path).stem
 
-        annotations = task.get("annotations", [])
-        if not annotations:
-            continue
+            annotations = task.get("annotations", [])
+            if not annotations:
+                continue
 
-        latest = annotations[-1]
-        results = latest.get("result", [])
+            latest = annotations[-1]
+            results = latest.get("result", [])
 
-        lines = []
-        for r in results:
-            if r.get("type") != "rectanglelabels":
-                continue
-            value = r["value"]
-            labels = value.get("rectanglelabels", [])
-            if not labels:
-                continue
+            lines = []
+            for r in results:
+                if r.get("type") != "rectanglelabels":
+                    continue
+                value = r["value"]
+                labels = value.get("rectanglelabels", [])
+                if not labels:
+                    continue
 
-            label_name = labels[0]
-            class_id = CLASS_NAME_TO_ID.get(label_name)
-            if class_id is None:
-                continue
+                label_name = labels[0]
+                class_id = CLASS_NAME_TO_ID.get(label_name)
+                if class_id is None:
+                    continue
 
-            x_pct = value["x"]
-            y_pct = value["y"]
-            w_pct = value["width"]
-            h_pct = value["height"]
+                x_pct = value["x"]
+                y_pct = value["y"]
+                w_pct = value["width"]
+                h_pct = value["height"]
 
-            cx = (x_pct + w_pct / 2) / 100.0
-            cy = (y_pct + h_pct / 2) / 100.0
-            w = w_pct / 100.0
-            h = h_pct / 100.0
+                cx = (x_pct + w_pct / 2) / 100.0
+                cy = (y_pct + h_pct / 2) / 100.0
+                w = w_pct / 100.0
+                h = h_pct / 100.0
 
-            lines.append(f"{class_id} {cx:.6f} {cy:.6f} {w:.6f} {h:.6f}")
+                lines.append(f"{class_id} {cx:.6f} {cy:.6f} {w:.6f} {h:.6f}")
 
-        label_path = output_dir / f"{stem}.txt"
-        label_path.write_text("\n".join(lines) + ("\n" if lines else ""))
-        exported += 1
+            write_label_file(output_dir / f"{stem}.txt", "".join(line + "\n" for line in lines))
+            exported += 1
 
     print(f"[INFO] Exported {exported} label files to {output_dir}")
 
 
+def positive_int(value: str) -> int:
+    """argparse type for counts that must be at least 1."""
+    n = int(value)
+    if n < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {value}")
+    return n
+
+
 def build_arg_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         description="Import/export golf labels with Label Studio"
@@ -389,6 +589,14 @@ def build_arg_parser() -> argparse.ArgumentParser:
         "--project-name", default="Golf Ball Detection",
         help="Label Studio project name"
     )
+    parser.add_argument(
+        "--batch-size", type=positive_int, default=20,
+        help="Images per upload request, capped at 20 MB (default: 20)"
+    )
+    parser.add_argument(
+        "--concurrency", type=positive_int, default=6,
+        help="Upload / prediction requests in flight at once (default: 6)"
+    )
 
     # Export mode
     parser.add_argument(
@@ -417,15 +625,15 @@ def main():
         if not args.project_id:
             print("[ERROR] --project-id is required when using --export")
             sys.exit(1)
-        export_from_label_studio(
+        asyncio.run(export_from_label_studio(
             project_id=args.project_id,
             output_dir=Path(args.output),
             ls_url=args.ls_url,
             email=args.email,
             password=args.password,
-        )
+        ))
     else:
-        import_to_label_studio(
+        asyncio.run(import_to_label_studio(
             images_dir=Path(args.images),
             labels_dir=Path(args.labels),
             ls_url=args.ls_url,
@@ -433,7 +641,9 @@ def main():
             password=args.password,
             project_name=args.project_name,
             project_id=args.project_id,
-        )
+            batch_size=args.batch_size,
+            concurrency=args.concurrency,
+        ))
 
 
 if __name__ == "__main__":
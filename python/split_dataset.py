@@ -27,8 +27,10 @@ Examples:
 """
 
 import argparse
+import os
 import random
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 IMAGE_EXTENSIONS = {".jpg", ".jpeg", ".png", ".bmp", ".tif", ".tiff", ".webp"}
@@ -36,15 +38,20 @@ IMAGE_EXTENSIONS = {".jpg", ".jpeg", ".png", ".bmp", ".tif", ".tiff", ".webp"}
 
 def collect_images(directory: Path) -> list[Path]:
     """Gather image files sorted by name."""
-    return sorted(
-        p for p in directory.iterdir()
-        if p.suffix.lower() in IMAGE_EXTENSIONS
-    )
+    with os.scandir(directory) as entries:
+        names = sorted(
+            e.name for e in entries
+            if os.path.splitext(e.name)[1].lower() in IMAGE_EXTENSIONS and e.is_file()
+        )
+    return [directory / name for name in names]
 
 
-def chunk_list(lst: list, chunk_size: int) -> list[list]:
-    """Split a list into contiguous chunks of the given size."""
-    return [lst[i:i + chunk_size] for i in range(0, len(lst), chunk_size)]
+def move_file(src: Path, dst: Path):
+    """Move with a single rename; fall back to copy+delete across filesystems."""
+    try:
+        os.replace(src, dst)
+    except OSError:
+        shutil.move(str(src), str(dst))
 
 
 def split_dataset(
@@ -69,21 +76,23 @@ def split_dataset(
         val_images_dir.mkdir(parents=True, exist_ok=True)
         val_labels_dir.mkdir(parents=True, exist_ok=True)
 
-    # Group into temporal chunks so consecutive frames stay together
-    chunks = chunk_list(images, chunk_size)
-
-    # Shuffle chunks (not individual frames) to avoid near-duplicates
-    # ending up in different sets
-    random.seed(seed)
-    random.shuffle(chunks)
+    # Group into temporal chunks so consecutive frames stay together, then
+    # shuffle chunk indices (not individual frames) to avoid near-duplicates
+    # ending up in different sets.  Chunk i is images[i*size:(i+1)*size].
+    n_chunks = (len(images) + chunk_size - 1) // chunk_size
+    order = list(range(n_chunks))
+    random.Random(seed).shuffle(order)
 
-    val_chunk_count = max(1, int(len(chunks) * val_ratio))
-    val_chunks = chunks[:val_chunk_count]
-    val_images = [img for chunk in val_chunks for img in chunk]
+    val_chunk_count = max(1, int(n_chunks * val_ratio))
+    val_images = [
+        img
+        for ci in order[:val_chunk_count]
+        for img in images[ci * chunk_size:(ci + 1) * chunk_size]
+    ]
 
     print(f"[INFO] Total images:       {len(images)}")
     print(f"[INFO] Chunk size:         {chunk_size} frames")
-    print(f"[INFO] Total chunks:       {len(chunks)}")
+    print(f"[INFO] Total chunks:       {n_chunks}")
     print(f"[INFO] Val chunks:         {val_chunk_count}")
     print(f"[INFO] Val images:         {len(val_images)} ({len(val_images)/len(images)*100:.1f}%)")
     print(f"[INFO] Train images:       {len(images) - len(val_images)} ({(len(images)-len(val_images))/len(images)*100:.1f}%)")
@@ -97,21 +106,21 @@ def split_dataset(
         print(f"\n[DRY RUN] {len(val_images)} images would be moved. No files changed.")
         return
 
-    moved_images = 0
-    moved_labels = 0
-
-    for img_path in val_images:
-        # Move image
-        dest_img = val_images_dir / img_path.name
-        shutil.move(str(img_path), str(dest_img))
-        moved_images += 1
+    def move_pair(img_path: Path) -> int:
+        """Move an image and its label (if any); returns 1 if a label moved."""
+        move_file(img_path, val_images_dir / img_path.name)
 
-        # Move matching label if it exists
         label_path = train_labels_dir / (img_path.stem + ".txt")
-        if label_path.exists():
-            dest_label = val_labels_dir / label_path.name
-            shutil.move(str(label_path), str(dest_label))
-            moved_labels += 1
+        if not label_path.exists():
+            return 0
+        move_file(label_path, val_labels_dir / label_path.name)
+        return 1
+
+    # Moves are bound by per-file syscall latency, not bandwidth, so many
+    # can be in flight at once
+    with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as pool:
+        moved_labels = sum(pool.map(move_pair, val_images))
+    moved_images = len(val_images)
 
     print("═" * 60)
     print(f"  Moved {moved_images} images to {val_images_dir}")